@@ -0,0 +1,53 @@
+from pxr import Usd, Sdf
+from qtpy import QtCore
+
+from usd_qtpy.prim_hierarchy_model import HierarchyModel
+
+
+def _names(model, parent):
+    return [
+        model.index(row, 0, parent).data()
+        for row in range(model.rowCount(parent))
+    ]
+
+
+def test_resync_updates_rows(qapp):
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/A/B")
+    stage.DefinePrim("/C")
+    model = HierarchyModel(stage=stage)
+
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+
+    root_index = model.index(0, 0, QtCore.QModelIndex())
+    assert _names(model, root_index) == ["A", "C"]
+    a_index = model.index(0, 0, root_index)
+    assert _names(model, a_index) == ["B"]
+
+    stage.DefinePrim("/A/D")
+    stage.RemovePrim("/C")
+    model.flush_changes()
+    assert _names(model, root_index) == ["A"]
+    assert _names(model, a_index) == ["B", "D"]
+    assert not resets
+
+
+
+def test_remove_and_redefine_before_flush(qapp):
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/A/B")
+    model = HierarchyModel(stage=stage)
+    root_index = model.index(0, 0, QtCore.QModelIndex())
+    a_index = model.index(0, 0, root_index)
+    assert _names(model, a_index) == ["B"]
+
+    # Replace the prim at the same path before the changes are flushed
+    stage.RemovePrim("/A")
+    stage.DefinePrim("/A/C")
+    model.flush_changes()
+    assert _names(model, root_index) == ["A"]
+    a_index = model.index(0, 0, root_index)
+    prim = a_index.data(HierarchyModel.PrimRole)
+    assert prim.GetPath() == Sdf.Path("/A")
+    assert _names(model, a_index) == ["C"]
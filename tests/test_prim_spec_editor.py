@@ -0,0 +1,151 @@
+from pxr import Usd, Sdf
+from qtpy import QtCore
+
+from usd_qtpy.prim_spec_editor import StageSdfModel, SpecEditsWidget
+
+
+def _create_stage():
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/A", "Xform")
+    stage.OverridePrim("/A/B")
+    stage.GetPrimAtPath("/A").CreateAttribute("x", Sdf.ValueTypeNames.Float)
+    return stage
+
+
+def _names(model, parent):
+    return [
+        model.index(row, 0, parent).data()
+        for row in range(model.rowCount(parent))
+    ]
+
+
+def test_build_model(qapp):
+    stage = _create_stage()
+    model = StageSdfModel(stage=stage)
+    model.refresh()
+
+    # The session and root layer, each with their pseudo-root spec
+    assert _names(model, QtCore.QModelIndex()) == [
+        "tmp-session.usda", "tmp.usda"
+    ]
+    root_index = model.index(0, 0, model.index(1, 0))
+    assert _names(model, root_index) == ["A"]
+    assert _names(model, model.index(0, 0, root_index)) == [".x", "B"]
+
+    items = model.get_items_for_path("/A/B")
+    assert len(items) == 1
+    assert items[0]["specifier"] == "over"
+    assert model.get_items_for_path("/A")[0]["specifier"] == "def"
+    assert model.get_spec_count() == 5
+
+
+def test_update_paths_resync_in_place(qapp):
+    stage = _create_stage()
+    model = StageSdfModel(stage=stage)
+    model.refresh()
+
+    resets = []
+    inserted = []
+    removed = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append(first)
+    )
+    model.rowsRemoved.connect(
+        lambda parent, first, last: removed.append(first)
+    )
+
+    a_index = model.index(0, 0, model.index(0, 0, model.index(1, 0)))
+    assert a_index.data() == "A"
+
+    # Add a new child prim
+    stage.DefinePrim("/A/C")
+    assert model.update_paths([Sdf.Path("/A/C")], [])
+    assert _names(model, a_index) == [".x", "B", "C"]
+    assert inserted == [2]
+    assert len(model.get_items_for_path("/A/C")) == 1
+
+    # Rebuild an existing prim with its children, defining "/A/B/D" also
+    # changes the specifier of the "/A/B" over to def
+    stage.DefinePrim("/A/B/D")
+    assert model.update_paths([Sdf.Path("/A/B")], [])
+    b_index = model.index(1, 0, a_index)
+    assert b_index.data() == "B"
+    assert _names(model, b_index) == ["D"]
+    assert model.get_items_for_path("/A/B")[0]["specifier"] == "def"
+
+    # Remove a prim
+    stage.RemovePrim("/A/C")
+    assert model.update_paths([Sdf.Path("/A/C")], [])
+    assert _names(model, a_index) == [".x", "B"]
+    assert not model.get_items_for_path("/A/C")
+
+    assert not resets
+    assert model.get_spec_count() == 6
+
+
+def test_spec_edits_widget_expands_resynced_rows(qapp):
+    stage = _create_stage()
+    widget = SpecEditsWidget(stage=stage)
+    view = widget.view
+    proxy = widget.proxy
+
+    stage.DefinePrim("/A/C/D")
+    a_index = proxy.index(0, 0, proxy.index(0, 0, proxy.index(1, 0)))
+    c_index = proxy.index(2, 0, a_index)
+    assert c_index.data() == "C"
+    assert view.isExpanded(c_index)
+
+    # Rows accepted again by a filter change are not expanded on insert
+    proxy.setFilterFixedString(".x")
+    view.collapseAll()
+    proxy.setFilterFixedString("")
+    a_index = proxy.index(0, 0, proxy.index(0, 0, proxy.index(1, 0)))
+    c_index = proxy.index(2, 0, a_index)
+    assert c_index.data() == "C"
+    assert not view.isExpanded(c_index)
+
+
+def test_update_paths_target_and_connection_edits(qapp):
+    stage = _create_stage()
+    prim = stage.GetPrimAtPath("/A")
+    rel = prim.CreateRelationship("rel")
+    rel.AddTarget("/A/B")
+    attr = prim.CreateAttribute("y", Sdf.ValueTypeNames.Float)
+    model = StageSdfModel(stage=stage)
+    model.refresh()
+
+    def _child_names(path):
+        item = model.get_items_for_path(path)[0]
+        return [child["name"] for child in item.children()]
+
+    assert _child_names("/A.rel") == ["[/A/B]"]
+
+    # Target and connection edits rebuild the child rows of the property
+    rel.AddTarget("/D")
+    attr.AddConnection("/A.x")
+    assert model.update_paths([], [Sdf.Path("/A.rel"), Sdf.Path("/A.y")])
+    assert _child_names("/A.rel") == ["[/A/B]", "[/D]"]
+    assert _child_names("/A.y") == ["[/A.x]"]
+
+    # Changes to values keep the existing items
+    item = model.get_items_for_path("/A.x")[0]
+    prim.GetAttribute("x").Set(1.0)
+    assert model.update_paths([], [Sdf.Path("/A.x")])
+    assert model.get_items_for_path("/A.x")[0] is item
+    assert item["default"] == "1.0"
+
+
+def test_spec_edits_widget_filters_per_widget(qapp):
+    first = SpecEditsWidget(stage=_create_stage())
+    second = SpecEditsWidget(stage=_create_stage())
+
+    # A pending filter of one widget is not cancelled by another widget
+    first.on_filter_changed("B")
+    second.on_filter_changed("x")
+    assert first._filter_timer.isActive()
+    assert second._filter_timer.isActive()
+
+    # Only the root layer has matching specs
+    first._filter_timer.timeout.emit()
+    assert _names(first.proxy, QtCore.QModelIndex()) == ["tmp.usda"]
@@ -0,0 +1,44 @@
+from pxr import Usd, Sdf
+
+from usd_qtpy.prim_hierarchy_model import HierarchyModel
+from usd_qtpy.references import ReferenceListWidget, PickPrimPath
+
+
+def test_reference_list_widget(qapp, tmp_path):
+    filepath = str(tmp_path / "asset.usda")
+    asset = Usd.Stage.CreateNew(filepath)
+    asset.DefinePrim("/asset")
+    asset.Save()
+
+    stage = Usd.Stage.CreateInMemory()
+    prim = stage.DefinePrim("/A")
+    prim.GetReferences().AddReference(filepath, Sdf.Path("/asset"))
+
+    widget = ReferenceListWidget(prim=prim)
+    widgets = widget._widgets["references"]
+    assert [entry.item.assetPath for entry in widgets] == [filepath]
+
+    # Picked stages are released when the dialog finishes
+    with Usd.StageCacheContext(widget._stage_cache):
+        Usd.Stage.Open(filepath, load=Usd.Stage.LoadNone)
+    assert widget._stage_cache.Size() == 1
+    widget.reject()
+    assert widget._stage_cache.Size() == 0
+
+
+def test_pick_prim_path_selects_nested_path(qapp):
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/A/B/C")
+    stage.DefinePrim("/D")
+
+    picker = PickPrimPath(stage=stage, prim_path="/A/B")
+    index = picker.view.currentIndex()
+    assert index.isValid()
+    prim = index.data(HierarchyModel.PrimRole)
+    assert prim.GetPath() == Sdf.Path("/A/B")
+    assert picker.view.isExpanded(index.parent())
+    assert not picker.view.isExpanded(index)
+
+    # Paths that do not exist select nothing
+    picker = PickPrimPath(stage=stage, prim_path="/A/X")
+    assert not picker.view.currentIndex().isValid()
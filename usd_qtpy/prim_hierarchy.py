@@ -26,6 +26,10 @@ class View(QtWidgets.QTreeView):
     #   CTRL + G: Group (add Xform above current selection)
     #   Delete or backspace: Remove the selected prims
 
+    # Registered prim types are static for the session, so we only need
+    # to query the plug-in registry once for the "All Registered" menu
+    _types_by_group_cache = None
+
     def __init__(self, *args, **kwargs):
         super(View, self).__init__(*args, **kwargs)
         self.setHeaderHidden(True)
@@ -58,13 +62,9 @@ class View(QtWidgets.QTreeView):
                 # Typeless
                 type_name = ""
 
-            # Define prim and signal change to the model
-            # TODO: Remove signaling once model listens to changes
-            current_rows = model.rowCount(index)
-            model.beginInsertRows(index, current_rows, current_rows+1)
+            # Define prim; the model inserts the row on the stage change
             new_prim = stage.DefinePrim(prim_path, type_name)
             self.select_paths([new_prim.GetPath()])
-            model.endInsertRows()
 
         # Create Prims
         create_prim_menu = menu.addMenu("Create Prim")
@@ -86,13 +86,8 @@ class View(QtWidgets.QTreeView):
         create_prim_menu.addAction("Camera")
         create_prim_menu.addSeparator()
 
-        # TODO: Cache this submenu?
-        types_by_group = get_prim_types_by_group()
         all_registered_menu = create_prim_menu.addMenu("All Registered")
-        for group, types in types_by_group.items():
-            group_menu = all_registered_menu.addMenu(group)
-            for type_name in types:
-                group_menu.addAction(type_name)
+        self._populate_all_registered_menu(all_registered_menu)
 
         create_prim_menu.triggered.connect(create_prim)
 
@@ -141,6 +136,19 @@ class View(QtWidgets.QTreeView):
         global_pos = self.viewport().mapToGlobal(point)
         menu.exec_(global_pos)
 
+    @classmethod
+    def _get_cached_prim_types_by_group(cls) -> dict:
+        """Return cached registered prim type names by plug-in grouping"""
+        if cls._types_by_group_cache is None:
+            cls._types_by_group_cache = get_prim_types_by_group()
+        return cls._types_by_group_cache
+
+    def _populate_all_registered_menu(self, menu):
+        for group, types in self._get_cached_prim_types_by_group().items():
+            group_menu = menu.addMenu(group)
+            for type_name in types:
+                group_menu.addAction(type_name)
+
     def on_manage_prim_reference_payload(self, prim):
         widget = ReferenceListWidget(prim=prim, parent=self)
         widget.resize(800, 300)
@@ -188,6 +196,10 @@ class View(QtWidgets.QTreeView):
         assert isinstance(model, HierarchyModel)
         selection = QtCore.QItemSelection()
 
+        # Ensure recent stage changes, like newly created prims, are
+        # reflected in the model before we search it
+        model.flush_changes()
+
         if not paths:
             self.selectionModel().clear()
             return
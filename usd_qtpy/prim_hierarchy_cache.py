@@ -1,5 +1,5 @@
 import logging
-from typing import List, Dict
+from typing import Dict, Optional, Tuple
 
 from pxr import Usd, Sdf
 
@@ -8,40 +8,83 @@ log = logging.getLogger(__name__)
 
 
 class Proxy:
-    def __init__(self, prim: Usd.Prim):
+    __slots__ = ("_prim", "_path", "_parent", "_children", "_children_index")
+
+    def __init__(self,
+                 prim: Usd.Prim,
+                 parent: Optional["Proxy"] = None,
+                 path: Optional[Sdf.Path] = None):
         self._prim: Usd.Prim = prim
-        self._children: List[Sdf.Path] = []
+        self._path: Sdf.Path = prim.GetPath() if path is None else path
+        self._parent: Optional[Proxy] = parent
+        self._children: Tuple[Sdf.Path, ...] = ()
+        self._children_index: Optional[Dict[Sdf.Path, int]] = None
 
     def refresh_children(self, predicate):
-        self._children = [
-            child_prim.GetPath()
-            for child_prim in self._prim.GetFilteredChildren(predicate)
-        ]
-
-    def get_children(self) -> List[Sdf.Path]:
+        self.set_children(self.compute_children(predicate))
+
+    def compute_children(self, predicate) -> Tuple[Sdf.Path, ...]:
+        """Return the current child paths of the prim without caching them"""
+        if not self._prim.IsValid():
+            return ()
+        # Query only the names to avoid creating a Usd.Prim for each child
+        path = self._path
+        return tuple(
+            path.AppendChild(name)
+            for name in self._prim.GetFilteredChildrenNames(predicate)
+        )
+
+    def set_children(self, children: Tuple[Sdf.Path, ...]):
+        self._children = children
+        # The row lookup is built on first use, so it is skipped for prims
+        # whose child rows are never queried and for intermediate states
+        # while rows are inserted or removed
+        self._children_index = None
+
+    def get_children(self) -> Tuple[Sdf.Path, ...]:
         return self._children
 
+    def get_child_row(self, path: Sdf.Path) -> int:
+        children_index = self._children_index
+        if children_index is None:
+            children_index = {
+                child: row for row, child in enumerate(self._children)
+            }
+            self._children_index = children_index
+        return children_index[path]
+
     def get_prim(self) -> Usd.Prim:
         return self._prim
 
+    def get_path(self) -> Sdf.Path:
+        return self._path
+
+    def get_parent(self) -> Optional["Proxy"]:
+        return self._parent
+
 
 class HierarchyCache:
+    __slots__ = ("_predicate", "_path_to_proxy", "_root", "_invalid_prim")
+
     def __init__(self,
                  root: Usd.Prim,
                  predicate: Usd.PrimDefaultPredicate):
         self._predicate = predicate
         self._path_to_proxy: Dict[Sdf.Path, Proxy] = {}
 
-        self._register_prim(root)
-        self._root: Proxy = self._path_to_proxy[root.GetPath()]
-        self._invalid_prim: Proxy = Proxy(Usd.Prim())
+        self._root: Proxy = self._register_prim(root)
+        self._invalid_prim: Proxy = Proxy(Usd.Prim(), path=Sdf.Path())
 
-    def _register_prim(self, prim: Usd.Prim):
+    def _register_prim(self,
+                       prim: Usd.Prim,
+                       parent: Optional[Proxy] = None) -> Proxy:
         path = prim.GetPath()
-        if path not in self._path_to_proxy:
-            proxy = Proxy(prim)
+        proxy = self._path_to_proxy.get(path)
+        if proxy is None:
+            proxy = Proxy(prim, parent, path)
             self._path_to_proxy[path] = proxy
             proxy.refresh_children(self._predicate)
+        return proxy
 
     @property
     def root(self) -> Proxy:
@@ -57,28 +100,30 @@ class HierarchyCache:
     def __getitem__(self, item):
         return self.get_proxy(item)
 
+    def get(self, path: Sdf.Path, default=None) -> Optional[Proxy]:
+        return self._path_to_proxy.get(path, default)
+
     def get_proxy(self, path: Sdf.Path) -> Proxy:
         return self._path_to_proxy[path]
 
     def get_child(self, proxy: Proxy, index: int) -> Proxy:
         if not proxy or not proxy.get_prim():
             return self._invalid_prim
-        if index >= self.get_child_count(proxy):
-            return self._invalid_prim
 
-        child_path = proxy.get_children()[index]
+        children = proxy.get_children()
+        if index >= len(children):
+            return self._invalid_prim
 
-        if child_path not in self._path_to_proxy:
+        child_path = children[index]
+        child = self._path_to_proxy.get(child_path)
+        if child is None:
             child_prim = proxy.get_prim().GetChild(child_path.name)
-            self._register_prim(child_prim)
+            child = self._register_prim(child_prim, parent=proxy)
 
-        return self._path_to_proxy[child_path]
+        return child
 
-    def get_parent(self, proxy: Proxy):
-        prim = proxy.get_prim()
-        path = prim.GetPath()
-        parent_path = path.GetParentPath()
-        return self._path_to_proxy[parent_path]
+    def get_parent(self, proxy: Proxy) -> Optional[Proxy]:
+        return proxy.get_parent()
 
     def get_child_count(self, proxy: Proxy) -> int:
         if not proxy or not proxy.get_prim():
@@ -86,49 +131,24 @@ class HierarchyCache:
 
         return len(proxy.get_children())
 
-    def _invalidate_subtree(self, path: Sdf.Path):
-        proxy = self._path_to_proxy.get(path)
-        if proxy is not None:
-            prim = proxy.get_prim()
-            if prim.IsValid() and self.predicate(prim):
-                for child in proxy.get_children():
-                    self._invalidate_subtree(child)
-                proxy.refresh_children(self.predicate)
-            else:
-                self._delete_subtree(path)
-        else:
-            log.debug("Skipping invalidation of uninstantiated path '%s'",
-                      path.pathString)
-
-    def _delete_subtree(self, path: Sdf.Path):
-        if self._path_to_proxy.pop(path, None) is None:
-            log.debug("Deleting instantiated path: '%s'", path)
-        else:
+    def delete_subtree(self, path: Sdf.Path):
+        proxy = self._path_to_proxy.pop(path, None)
+        if proxy is None:
             log.debug("Skipping deletion of uninstantiated path: '%s'", path)
+            return
 
-    def resync_subtrees(self, paths: set[Sdf.Path]):
-        root_path = Sdf.Path("/")
-        if root_path in paths:
-            # Resync all
-            unique_parents = {root_path}
-        else:
-            unique_parents = {path.GetParentPath() for path in paths}
-
-        for parent_path in unique_parents:
-            proxy = self._path_to_proxy.get(parent_path)
-            if not proxy:
-                continue
+        log.debug("Deleting instantiated path: '%s'", path)
 
-            log.debug("Updating children of parent: '%s'", parent_path)
-            original_children = set(proxy.get_children())
-            proxy.refresh_children(self.predicate)
-            new_children = set(proxy.get_children())
-
-            for child_path in original_children.union(new_children):
-                self._invalidate_subtree(child_path)
+        # Also remove any cached descendants so that none remain that still
+        # refer to the removed proxy as their parent
+        stack = list(proxy.get_children())
+        while stack:
+            child = self._path_to_proxy.pop(stack.pop(), None)
+            if child is not None:
+                stack.extend(child.get_children())
 
     def is_root(self, proxy):
-        return self._root.get_prim() == proxy.get_prim()
+        return proxy is self._root
 
     def get_row(self, proxy: Proxy) -> int:
         if not proxy:
@@ -137,9 +157,7 @@ class HierarchyCache:
         if self.is_root(proxy):
             return 0
 
-        parent_path = proxy.get_prim().GetPath().GetParentPath()
-        parent = self._path_to_proxy[parent_path]
-
-        prim = proxy.get_prim()
-        path = prim.GetPath()
-        return parent.get_children().index(path)
\ No newline at end of file
+        parent = proxy.get_parent()
+        if parent is None:
+            return 0
+        return parent.get_child_row(proxy.get_path())
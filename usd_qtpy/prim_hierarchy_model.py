@@ -1,5 +1,7 @@
 import logging
 import contextlib
+import threading
+from collections import defaultdict
 from typing import Union, Optional
 
 from qtpy import QtCore
@@ -7,10 +9,46 @@ from pxr import Usd, Sdf, Tf
 
 from .lib.qt import report_error
 from .lib.usd import rename_prim
-from .prim_type_icons import PrimTypeIconProvider
+from .prim_type_icons import get_shared_provider
 from .prim_delegate import DrawRectsDelegate
 from .prim_hierarchy_cache import HierarchyCache, Proxy
 
+log = logging.getLogger("HierarchyModel")
+
+
+# Tags drawn by `DrawRectsDelegate`. These are shared by all rows and
+# should be considered read-only.
+DEFAULT_PRIM_RECT = {
+    "text": "DFT",
+    "tooltip": "This prim is the default prim on the stage's root layer.",
+    "background-color": "#553333"
+}
+REFERENCE_RECT = {
+    "text": "REF",
+    "tooltip": "This prim has one or more references and/or payloads.",
+    "background-color": "#333355"
+}
+VARIANT_RECT = {
+    "text": "VAR",
+    "tooltip": "One or more variant sets exist on this prim.",
+    "background-color": "#335533"
+}
+
+
+def _iter_row_ranges(rows):
+    """Yield (first, last) tuples for each consecutive range in sorted rows"""
+    rows = iter(rows)
+    first = last = next(rows, None)
+    if first is None:
+        return
+
+    for row in rows:
+        if row != last + 1:
+            yield first, last
+            first = row
+        last = row
+    yield first, last
+
 
 @contextlib.contextmanager
 def layout_change_context(model: QtCore.QAbstractItemModel):
@@ -37,6 +75,11 @@ class HierarchyModel(QtCore.QAbstractItemModel):
     """
     PrimRole = QtCore.Qt.UserRole + 1
 
+    # Delay in milliseconds to collect stage changes before the model is
+    # updated, so that bursts of change notices result in a single update.
+    # This is applied on initialization of the model.
+    max_batch_delay = 0
+
     def __init__(
         self,
         stage: Usd.Stage=None,
@@ -61,8 +104,27 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         self._stage = None
         self._index: Union[None, HierarchyCache] = None
         self._listeners = []
-        self._icon_provider = PrimTypeIconProvider()
-        self.log = logging.getLogger("HierarchyModel")
+        self._icon_provider = get_shared_provider()
+        self.log = log
+
+        # Data getters per item data role. These are bound methods so that
+        # subclasses can override the individual handlers.
+        self._role_handlers = {
+            QtCore.Qt.DisplayRole: self._data_name,
+            QtCore.Qt.EditRole: self._data_name,
+            QtCore.Qt.DecorationRole: self._data_icon,
+            QtCore.Qt.ToolTipRole: self._data_type_name,
+            self.PrimRole: self._data_prim,
+            DrawRectsDelegate.RectDataRole: self._data_rects,
+        }
+
+        self._rects_cache = {}
+        self._pending_resync = set()
+        self._pending_lock = threading.Lock()
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.max_batch_delay)
+        self._flush_timer.timeout.connect(self.flush_changes)
 
         # Set stage
         self.set_stage(stage)
@@ -84,6 +146,10 @@ class HierarchyModel(QtCore.QAbstractItemModel):
             return
 
         self.revoke_listeners()
+        self._flush_timer.stop()
+        with self._pending_lock:
+            self._pending_resync.clear()
+        self._rects_cache.clear()
 
         self._stage = stage
         with self.reset_model():
@@ -99,6 +165,10 @@ class HierarchyModel(QtCore.QAbstractItemModel):
     def _is_stage_valid(self):
         return self._stage and self._stage.GetPseudoRoot()
 
+    # The Qt methods below are called for each visible row on every paint
+    # so they check for `self._index`, which is only set on a valid stage,
+    # instead of querying the stage through `_is_stage_valid`
+
     def register_listeners(self):
         """Register Tf.Notice listeners"""
 
@@ -141,55 +211,216 @@ class HierarchyModel(QtCore.QAbstractItemModel):
             # Also include the absolute root path (e.g. layer muting)
             or path.IsAbsoluteRootPath()
         }
+
+        # The tags drawn for prims depend on the composed prims and on the
+        # default prim, which is metadata on the absolute root path
+        if self._rects_cache and (
+                resynced_paths
+                or any(path.IsAbsoluteRootPath()
+                       for path in notice.GetChangedInfoOnlyPaths())
+        ):
+            self._rects_cache.clear()
+
+        if not resynced_paths:
+            return
+
+        # Collect the changes and process them once control returns to the
+        # event loop so that many notices result in a single model update
+        with self._pending_lock:
+            schedule = not self._pending_resync
+            self._pending_resync.update(resynced_paths)
+
+        if schedule:
+            if QtCore.QThread.currentThread() == self.thread():
+                self._flush_timer.start()
+            else:
+                # Notices are sent on the thread that changed the stage, so
+                # we start the timer through the thread owning the model
+                QtCore.QMetaObject.invokeMethod(self._flush_timer,
+                                                "start",
+                                                QtCore.Qt.QueuedConnection)
+
+    @report_error
+    def flush_changes(self):
+        """Update the model for any pending stage changes directly.
+
+        Changes are processed automatically on the next event loop cycle,
+        but a client can call this to ensure the model is up-to-date with
+        the stage, e.g. to select a prim right after defining it.
+        """
+        self._flush_timer.stop()
+        with self._pending_lock:
+            resynced_paths = self._pending_resync
+            self._pending_resync = set()
         if not resynced_paths:
             return
 
-        # Include parents so we can use it as lookup for the "sibling" check
-        resynced_paths_and_parents = resynced_paths.copy()
-        resynced_paths_and_parents.update(
-            path.GetParentPath() for path in list(resynced_paths)
+        if not self._is_stage_valid():
+            return
+
+        # Skip the update entirely if none of the changes affect
+        # prims that the model has populated so far, e.g. changes to children
+        # of prims that were never expanded
+        if not any(
+            path.GetParentPath() in self._index or path in self._index
+            for path in resynced_paths
+        ):
+            return
+
+        root_path = Sdf.Path("/")
+        if root_path in resynced_paths:
+            # Resync all, e.g. on layer muting
+            with self.reset_model():
+                self._index = HierarchyCache(
+                    root=self._stage.GetPrimAtPath("/"),
+                    predicate=self._predicate
+                )
+            return
+
+        # Ignore paths that are descendants of other resynced paths since
+        # those are repopulated along with their resynced ancestor. Sorted
+        # paths list each ancestor directly before its descendants.
+        top_paths = []
+        for path in sorted(resynced_paths):
+            if not top_paths or not path.HasPrefix(top_paths[-1]):
+                top_paths.append(path)
+
+        resynced_by_parent = defaultdict(set)
+        for path in top_paths:
+            resynced_by_parent[path.GetParentPath()].add(path)
+
+        for parent_path, paths in resynced_by_parent.items():
+            parent_proxy = self._index.get(parent_path)
+            if parent_proxy is None:
+                # Parent was never populated in the model
+                continue
+
+            self._update_children(parent_proxy)
+
+            # Resynced prims that still exist may have entirely different
+            # descendants, so we repopulate their children
+            for path in paths:
+                proxy = self._index.get(path)
+                if proxy is not None:
+                    self._repopulate_children(proxy)
+
+    def _proxy_to_index(self, proxy: Proxy) -> QtCore.QModelIndex:
+        return self.createIndex(self._index.get_row(proxy), 0, proxy)
+
+    def _update_children(self, proxy: Proxy):
+        """Sync the cached children of the proxy with the stage.
+
+        Instead of resetting the model this emits the granular row removals
+        and insertions so that views can preserve their selection and
+        expanded state. Only if the order of the remaining children changed
+        a layout change is emitted.
+        """
+        old_children = proxy.get_children()
+        new_children = proxy.compute_children(self._index.predicate)
+
+        # A child that was removed and defined again before the changes were
+        # flushed keeps its path but its cached prim expired, so its row is
+        # replaced along with the cached subtree
+        expired = set()
+        for path in old_children:
+            child = self._index.get(path)
+            if child is not None and not child.get_prim():
+                expired.add(path)
+
+        if old_children == new_children and not expired:
+            return
+
+        parent_index = self._proxy_to_index(proxy)
+        old_paths = set(old_children).difference(expired)
+        new_paths = set(new_children).difference(expired)
+
+        # Remove rows; in reverse so that rows of earlier ranges stay valid
+        removed_rows = [
+            row for row, path in enumerate(old_children)
+            if path not in new_paths
+        ]
+        for first, last in reversed(list(_iter_row_ranges(removed_rows))):
+            self.beginRemoveRows(parent_index, first, last)
+            children = proxy.get_children()
+            for path in children[first:last + 1]:
+                self._index.delete_subtree(path)
+            proxy.set_children(children[:first] + children[last + 1:])
+            self.endRemoveRows()
+
+        # Reorder the remaining rows
+        kept_children = tuple(
+            path for path in new_children if path in old_paths
         )
+        if proxy.get_children() != kept_children:
+            self._reorder_children(proxy, kept_children)
+
+        # Insert rows; in order so that all rows before each range match
+        inserted_rows = [
+            row for row, path in enumerate(new_children)
+            if path not in old_paths
+        ]
+        for first, last in _iter_row_ranges(inserted_rows):
+            self.beginInsertRows(parent_index, first, last)
+            children = proxy.get_children()
+            proxy.set_children(
+                children[:first]
+                + new_children[first:last + 1]
+                + children[first:]
+            )
+            self.endInsertRows()
+
+    def _reorder_children(self, proxy: Proxy, children):
+        """Reorder the children of proxy, updating persistent indices"""
         with layout_change_context(self):
-            persistent_indices = self.persistentIndexList()
-            index_to_path = {}
-            for index in persistent_indices:
-                index_prim = index.internalPointer().get_prim()
-                index_path = index_prim.GetPath()
-                if (
-                        index_path in resynced_paths_and_parents
-                        or index_path.GetParentPath() in resynced_paths_and_parents
-                ):
-                    index_to_path[index] = index_path
+            proxy.set_children(children)
 
-            self._index.resync_subtrees(resynced_paths)
+            persistent_indices = self.persistentIndexList()
+            if not persistent_indices:
+                # No selection or expanded items in any view to update
+                return
 
             from_indices = []
             to_indices = []
-            for index in index_to_path:
-                path = index_to_path[index]
-
-                if path in self._index:
-                    new_proxy = self._index.get_proxy(path)
-                    new_row = self._index.get_row(new_proxy)
-
-                    if index.row() != new_row:
-                        for _i in range(
-                            self.columnCount(QtCore.QModelIndex())
-                        ):
-                            from_indices.append(index)
-                            to_indices.append(self.createIndex(
-                                new_row, index.column(), new_proxy)
-                            )
-                else:
+            for index in persistent_indices:
+                child = index.internalPointer()
+                if child.get_parent() is not proxy:
+                    continue
+
+                new_row = proxy.get_child_row(child.get_path())
+                if index.row() != new_row:
                     from_indices.append(index)
-                    to_indices.append(QtCore.QModelIndex())
-            self.changePersistentIndexList(from_indices, to_indices)
+                    to_indices.append(
+                        self.createIndex(new_row, index.column(), child)
+                    )
+            if from_indices:
+                self.changePersistentIndexList(from_indices, to_indices)
+
+    def _repopulate_children(self, proxy: Proxy):
+        """Remove all child rows of the proxy and insert them anew"""
+        index = self._proxy_to_index(proxy)
+
+        children = proxy.get_children()
+        if children:
+            self.beginRemoveRows(index, 0, len(children) - 1)
+            for path in children:
+                self._index.delete_subtree(path)
+            proxy.set_children(())
+            self.endRemoveRows()
+
+        children = proxy.compute_children(self._index.predicate)
+        if children:
+            self.beginInsertRows(index, 0, len(children) - 1)
+            proxy.set_children(children)
+            self.endInsertRows()
+
+        # The prim itself may have changed, e.g. its type
+        self.dataChanged.emit(index, index)
 
     def _prim_to_row_index(self,
                            path: Sdf.Path) -> Optional[QtCore.QModelIndex]:
         """Given a path, retrieve the appropriate model index."""
-        if path in self._index:
-            proxy = self._index[path]
+        proxy = self._index.get(path)
+        if proxy is not None:
             row = self._index.get_row(proxy)
             return self.createIndex(row, 0, proxy)
 
@@ -225,7 +456,12 @@ class HierarchyModel(QtCore.QAbstractItemModel):
                     # Keep original name
                     return False
 
+                # `rename_prim` authors all layer edits in a single
+                # `Sdf.ChangeBlock`; we then directly apply the resulting
+                # change so the view never repaints the renamed prim
+                # through a stale proxy
                 rename_prim(prim, value)
+                self.flush_changes()
                 return True
 
         return super(HierarchyModel, self).setData(index, value, role)
@@ -234,7 +470,7 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         return 1
 
     def rowCount(self, parent):
-        if not self._is_stage_valid():
+        if self._index is None:
             return 0
 
         if parent.column() > 0:
@@ -247,11 +483,13 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         return self._index.get_child_count(parent_proxy)
 
     def index(self, row, column, parent):
-        if not self._is_stage_valid():
+        if self._index is None:
             return QtCore.QModelIndex()
 
         if not self.hasIndex(row, column, parent):
-            self.log.debug("Index does not exist: %s %s %s", row, column, parent)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Index does not exist: %s %s %s",
+                          row, column, parent)
             return QtCore.QModelIndex()
 
         if not parent.isValid():
@@ -264,7 +502,7 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         return self.createIndex(row, column, child)
 
     def parent(self, index):
-        if not self._is_stage_valid():
+        if self._index is None:
             return QtCore.QModelIndex()
 
         if not index.isValid():
@@ -282,51 +520,53 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         return self.createIndex(parent_row, index.column(), parent_proxy)
 
     def data(self, index, role):
-        if not self._is_stage_valid():
+        if self._index is None:
             return
 
         if not index.isValid():
             return
 
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
-            prim = index.internalPointer().get_prim()
-            return prim.GetName()
-
-        if role == QtCore.Qt.DecorationRole:
-            # icon
-            prim = index.internalPointer().get_prim()
-            return self._icon_provider.get_icon(prim)
-
-        if role == QtCore.Qt.ToolTipRole:
-            prim = index.internalPointer().get_prim()
-            return prim.GetTypeName()
-
-        if role == self.PrimRole:
-            return index.internalPointer().get_prim()
-
-        if role == DrawRectsDelegate.RectDataRole:
-            prim = index.internalPointer().get_prim()
-            rects = []
-            if prim == self.stage.GetDefaultPrim():
-                rects.append(
-                    {"text": "DFT",
-                     "tooltip": "This prim is the default prim on "
-                                "the stage's root layer.",
-                     "background-color": "#553333"}
-                )
-            if prim.HasAuthoredPayloads() or prim.HasAuthoredReferences():
-                rects.append(
-                    {"text": "REF",
-                     "tooltip": "This prim has one or more references "
-                                "and/or payloads.",
-                     "background-color": "#333355"},
-                )
-            if prim.HasVariantSets():
-                rects.append(
-                    {"text": "VAR",
-                     "tooltip": "One or more variant sets exist on this prim.",
-                     "background-color": "#335533"},
-                )
+        handler = self._role_handlers.get(role)
+        if handler is None:
+            return
+
+        prim = index.internalPointer().get_prim()
+        if not prim:
+            # The prim was removed from the stage and the model is not yet
+            # updated because the pending changes were not flushed yet
+            return
+        return handler(prim)
+    # endregion
 
-            return rects
+    # region Data role handlers
+    def _data_name(self, prim):
+        return prim.GetName()
+
+    def _data_icon(self, prim):
+        return self._icon_provider.get_icon(prim)
+
+    def _data_type_name(self, prim):
+        return prim.GetTypeName()
+
+    def _data_prim(self, prim):
+        return prim
+
+    def _data_rects(self, prim):
+        path = prim.GetPath()
+        rects = self._rects_cache.get(path)
+        if rects is None:
+            rects = self._compute_rects(prim)
+            self._rects_cache[path] = rects
+        return rects
+
+    def _compute_rects(self, prim):
+        rects = []
+        if prim == self.stage.GetDefaultPrim():
+            rects.append(DEFAULT_PRIM_RECT)
+        if prim.HasAuthoredPayloads() or prim.HasAuthoredReferences():
+            rects.append(REFERENCE_RECT)
+        if prim.HasVariantSets():
+            rects.append(VARIANT_RECT)
+
+        return tuple(rects)
     # endregion
@@ -1,13 +1,15 @@
 import logging
+import operator
+from collections import defaultdict
 
 from pxr import Usd, Tf, Sdf
 from qtpy import QtCore, QtWidgets, QtGui
 
-from .lib.qt import schedule, report_error
+from .lib.qt import report_error
 from .lib.usd import remove_spec, LIST_ATTRS
 from .lib.usd_merge_spec import copy_spec_merge
 from .tree.simpletree import TreeModel, Item
-from .prim_type_icons import PrimTypeIconProvider
+from .prim_type_icons import get_shared_provider
 
 
 log = logging.getLogger(__name__)
@@ -18,6 +20,22 @@ SPECIFIER_LABEL = {
     Sdf.SpecifierOver: "over",
     Sdf.SpecifierClass: "abstract"
 }
+SPECIFIER_BY_LABEL = {
+    label: specifier for specifier, label in SPECIFIER_LABEL.items()
+}
+SPECIFIER_LABELS = list(SPECIFIER_LABEL.values())
+
+# Getters for the list edit proxies on a PrimSpec per item type, and for the
+# list edits per change type along with the change type's label
+LIST_PROXY_GETTERS = {
+    attr: operator.attrgetter(attr + "List")
+    for attr in ["reference", "payload", "variantSetName"]
+}
+LIST_CHANGE_GETTERS = [
+    # Strip off "Items" for the label
+    (change_type[:-5], operator.attrgetter(change_type))
+    for change_type in LIST_ATTRS
+]
 
 
 def shorten(s, width, placeholder="..."):
@@ -27,6 +45,18 @@ def shorten(s, width, placeholder="..."):
     return "{}{}".format(s[:width], placeholder)
 
 
+def get_attribute_spec_data(spec):
+    """Return the item data to display for an Sdf.AttributeSpec"""
+    value = spec.default
+    type_name = spec.roleName
+    if not type_name and value is not None:
+        type_name = type(value).__name__
+    return {
+        "default": shorten(str(value), 60),
+        "typeName": type_name
+    }
+
+
 class ListProxyItem(Item):
     """Item for entries inheriting from Sdf ListProxy types.
 
@@ -36,6 +66,8 @@ class ListProxyItem(Item):
     - Sdf.PrimSpec.payloadList
 
     """
+    __slots__ = ("_list_proxy", "_list_value")
+
     def __init__(self, proxy, value, data):
         super(ListProxyItem, self).__init__(data)
         self._list_proxy = proxy
@@ -54,6 +86,8 @@ class MapProxyItem(Item):
     - Sdf.PrimSpec.relocates
 
     """
+    __slots__ = ("_key", "_proxy")
+
     def __init__(self, proxy, key, data):
         super(MapProxyItem, self).__init__(data)
         self._key = key
@@ -69,7 +103,7 @@ class SpecifierDelegate(QtWidgets.QStyledItemDelegate):
 
     def createEditor(self, parent, option, index):
         editor = QtWidgets.QComboBox(parent)
-        editor.addItems(list(SPECIFIER_LABEL.values()))
+        editor.addItems(SPECIFIER_LABELS)
         return editor
 
     def setEditorData(self, editor, index):
@@ -85,6 +119,7 @@ class StageSdfModel(TreeModel):
     #   - "variantSets",
     #   - "relocates"
     Columns = ["name", "specifier", "typeName", "default", "type"]
+    PropertySpecTypes = {"AttributeSpec", "RelationshipSpec"}
     Colors = {
         "Layer": QtGui.QColor("#008EC5"),
         "PseudoRootSpec": QtGui.QColor("#A2D2EF"),
@@ -98,168 +133,483 @@ class StageSdfModel(TreeModel):
         "variantSetName":  QtGui.QColor("#D6E8CC"),
         "variantSelections":  QtGui.QColor("#D6E8CC"),
     }
+    # Brushes for `Colors` so the foreground role returns a shared brush
+    # instead of Qt converting the color to a brush for every request
+    Brushes = {key: QtGui.QBrush(color) for key, color in Colors.items()}
 
     def __init__(self, stage=None, parent=None):
         super(StageSdfModel, self).__init__(parent)
         self._stage = stage
 
-        self._icon_provider = PrimTypeIconProvider()
+        self._icon_provider = get_shared_provider()
+
+        # Spec items per composed prim or property path string
+        self._items_by_path = defaultdict(list)
+        # Spec items per layer identifier and spec path string
+        self._items_by_spec_path = {}
+
+        # Property spec types to build items for, None builds all of them
+        self._build_property_types = None
 
     def setStage(self, stage):
         self._stage = stage
 
     @report_error
     def refresh(self):
-        self.clear()
+        # Build the new hierarchy outside the model and swap it in with a
+        # single reset once it is complete
+        root_item = Item()
+        items_by_path = defaultdict(list)
+        items_by_spec_path = {}
 
         stage = self._stage
-        if not stage:
-            return
+        if stage:
+            self._build_items(stage, root_item, items_by_path,
+                              items_by_spec_path)
+
+        self.beginResetModel()
+        self._root_item = root_item
+        self._items_by_path = items_by_path
+        self._items_by_spec_path = items_by_spec_path
+        self.endResetModel()
+
+    def _build_items(self, stage, root_item, items_by_path,
+                     items_by_spec_path):
+        """Populate `root_item` with the layers and specs of the stage"""
+        # Icons of the composed prims per path string so that the prims are
+        # only retrieved from the stage once across all layers
+        icons_by_path = {}
 
         for layer in stage.GetLayerStack():
-
             layer_item = Item({
                 "name": layer.GetDisplayName() or layer.identifier,
                 "identifier": layer.identifier,
                 "specifier": None,
                 "type": layer.__class__.__name__
             })
-            self.add_child(layer_item)
-
-            items_by_path = {}
-
-            def _traverse(path):
-                spec = layer.GetObjectAtPath(path)
-                if not spec:
-                    # ignore target list binding entries or e.g. variantSetSpec
-                    items_by_path[path] = Item({
-                        "name": path.elementString,
-                        "path": path,
-                        "type": path.__class__.__name__
-                    })
-                    return
-
-                icon = None
-                spec_item = Item({
-                    "name": spec.name,
-                    "spec": spec,
+            root_item.add_child(layer_item)
+
+            # Any items whose parent was not traversed, like the pseudo-root,
+            # are parented directly under the layer
+            for _path, item in self._collect_spec_items(
+                stage, layer, Sdf.Path.absoluteRootPath,
+                items_by_path, items_by_spec_path, icons_by_path
+            ):
+                layer_item.add_child(item)
+
+    def _collect_spec_items(self, stage, layer, root_path, items_by_path,
+                            items_by_spec_path, icons_by_path):
+        """Build the items for the specs of a layer at and below a path.
+
+        The spec items are registered in `items_by_path` by their composed
+        path and in `items_by_spec_path` by layer identifier and spec path.
+
+        Returns:
+            list[tuple[Sdf.Path, Item]]: The items, sorted by path, of which
+                the parent was not traversed, e.g. the item for `root_path`.
+
+        """
+        # Bind the lookups used per spec in `_traverse` to locals
+        get_icon_from_type_name = self._icon_provider.get_icon_from_type_name
+        get_icon = self._icon_provider.get_icon
+        get_specifier_label = SPECIFIER_LABEL.get
+        prim_spec_type = Sdf.PrimSpec
+        attribute_spec_type = Sdf.AttributeSpec
+        property_spec_type = Sdf.PropertySpec
+        list_proxy_getters = LIST_PROXY_GETTERS
+        list_change_getters = LIST_CHANGE_GETTERS
+        build_property_types = self._build_property_types
+        get_object_at_path = layer.GetObjectAtPath
+        layer_id = layer.identifier
+
+        # Items per parent path string that are waiting for the parent's
+        # item to be created. `Sdf.Layer.Traverse` visits the paths in
+        # post-order so children are always visited before their parent.
+        # The dict is keyed by path string since hashing `Sdf.Path` goes
+        # through the python bindings
+        pending_children = defaultdict(list)
+
+        def _add_item(path, item):
+            # Parent the pending children under this item in path order
+            children = pending_children.pop(path.pathString, None)
+            if children:
+                children.sort(key=operator.itemgetter(0))
+                for _child_path, child_item in children:
+                    item.add_child(child_item)
+            parent_path_str = path.GetParentPath().pathString
+            pending_children[parent_path_str].append((path, item))
+
+        def _traverse(path):
+            spec = get_object_at_path(path)
+            if not spec:
+                # ignore target list binding entries or e.g. variantSetSpec
+                _add_item(path, Item({
+                    "name": path.elementString,
                     "path": path,
-                    "type": spec.__class__.__name__
-                })
-
-                element_string = spec.path.elementString
-                if element_string and spec.name != element_string:
-                    spec_item["name"] = element_string
-
-                if hasattr(spec, "GetTypeName"):
-                    spec_type_name = spec.GetTypeName()
-                    icon = self._icon_provider.get_icon_from_type_name(
-                        spec_type_name)
-                    if icon:
-                        spec_item["icon"] = icon
-
-                if isinstance(spec, Sdf.PrimSpec):
-                    if not icon:
-                        # If the current layer doesn't specify a type, e.g.
-                        # it is an "Over" but another layer does specify
-                        # a type, then use that type instead
+                    "type": path.__class__.__name__
+                }))
+                return
+
+            spec_type_name = spec.__class__.__name__
+            if (
+                build_property_types is not None
+                and spec_type_name not in build_property_types
+                and isinstance(spec, property_spec_type)
+            ):
+                # Skip the property along with its target paths
+                pending_children.pop(path.pathString, None)
+                return
+
+            spec_item = Item({
+                "name": spec.name,
+                "spec": spec,
+                "path": path,
+                "type": spec_type_name
+            })
+
+            element_string = spec.path.elementString
+            if element_string and spec.name != element_string:
+                spec_item["name"] = element_string
+
+            if isinstance(spec, prim_spec_type):
+                # Only prim specs define a prim type to get the icon for,
+                # the type name of properties is their value type
+                type_name = spec.typeName
+                icon = get_icon_from_type_name(type_name)
+                path_str = path.pathString
+                if icon:
+                    # Layers are traversed strongest first so the first
+                    # type found for a path is the prim's composed type
+                    icons_by_path.setdefault(path_str, icon)
+                else:
+                    # If the current layer doesn't specify a type, e.g.
+                    # it is an "Over" but another layer does specify
+                    # a type, then use that type instead
+                    try:
+                        icon = icons_by_path[path_str]
+                    except KeyError:
                         prim = stage.GetPrimAtPath(path)
                         if prim:
-                            icon = self._icon_provider.get_icon(prim)
-                            if icon:
-                                spec_item["icon"] = icon
-
-                    spec_item["specifier"] = SPECIFIER_LABEL.get(
-                        spec.specifier
-                    )
-                    type_name = spec.typeName
-                    spec_item["typeName"] = type_name
-
-                    def _add_map_item(attr):
-                        """Add MapProxyItem for list attribute on Spec"""
-                        proxy = getattr(spec, attr)
-
-                        # `prim_spec.variantSelections.keys()` can fail
-                        # todo: figure out why this workaround is needed
-                        try:
-                            keys = list(proxy.keys())
-                        except RuntimeError:
-                            return
-
-                        for key in keys:
-                            proxy_item = MapProxyItem(
-                                key=key,
-                                proxy=proxy,
+                            icon = get_icon(prim)
+                        icons_by_path[path_str] = icon
+                if icon:
+                    spec_item["icon"] = icon
+
+                spec_item["specifier"] = get_specifier_label(spec.specifier)
+                spec_item["typeName"] = type_name
+
+                def _add_map_item(attr):
+                    """Add MapProxyItem for list attribute on Spec"""
+                    proxy = getattr(spec, attr)
+
+                    # `prim_spec.variantSelections.keys()` can fail
+                    # todo: figure out why this workaround is needed
+                    try:
+                        keys = list(proxy.keys())
+                    except RuntimeError:
+                        return
+
+                    for key in keys:
+                        proxy_item = MapProxyItem(
+                            key=key,
+                            proxy=proxy,
+                            data={
+                                "name": key,
+                                "default": proxy.get(key),  # value
+                                "type": attr,
+                                "typeName": attr,
+                            }
+                        )
+                        spec_item.add_child(proxy_item)
+
+                def _add_list_item(attr):
+                    """Add ListProxyItem for list attribute on Spec"""
+                    list_changes = list_proxy_getters[attr](spec)
+                    if not list_changes:
+                        return
+
+                    add_child = spec_item.add_child
+                    for change_label, get_changes in list_change_getters:
+                        changes_for_type = get_changes(list_changes)
+                        for change in changes_for_type:
+
+                            if hasattr(change, "assetPath"):
+                                # Sdf.Reference and Sdf.Payload
+                                name = change.assetPath
+                            else:
+                                # variantSetName
+                                name = str(change)
+
+                            list_change_item = ListProxyItem(
+                                proxy=changes_for_type,
+                                value=change,
                                 data={
-                                    "name": key,
-                                    "default": proxy.get(key),  # value
+                                    "name": name,
+                                    "default": change_label,
                                     "type": attr,
                                     "typeName": attr,
+                                    "parent": changes_for_type
                                 }
                             )
-                            spec_item.add_child(proxy_item)
-
-                    def _add_list_item(attr):
-                        """Add ListProxyItem for list attribute on Spec"""
-                        list_changes = getattr(spec, attr + "List")
-                        for change_type in LIST_ATTRS:
-                            changes_for_type = getattr(list_changes,
-                                                       change_type)
-                            for change in changes_for_type:
-
-                                if hasattr(change, "assetPath"):
-                                    # Sdf.Reference and Sdf.Payload
-                                    name = change.assetPath
-                                else:
-                                    # variantSetName
-                                    name = str(change)
-
-                                list_change_item = ListProxyItem(
-                                    proxy=changes_for_type,
-                                    value=change,
-                                    data={
-                                        "name": name,
-                                        # Strip off "Items"
-                                        "default": change_type[:-5],
-                                        "type": attr,
-                                        "typeName": attr,
-                                        "parent": changes_for_type
-                                    }
-                                )
-                                spec_item.add_child(list_change_item)
-                        if list_changes:
-                            spec_item[attr] = str(list_changes)
-
-                    # Add these types intermixed just so we order attributes
-                    # together nicely that are somewhat related, e.g. variant
-                    # information together
-                    for attr, add_fn in [
-                        ("reference", _add_list_item),
-                        ("payload", _add_list_item),
-                        ("relocates", _add_map_item),
-                        ("variantSelections", _add_map_item),
-                        ("variantSetName", _add_list_item),
-                    ]:
-                        add_fn(attr)
-
-                elif isinstance(spec, Sdf.AttributeSpec):
-                    value = spec.default
-                    spec_item["default"] = shorten(str(value), 60)
-
-                    type_name = spec.roleName
-                    if not type_name and value is not None:
-                        type_name = type(value).__name__
-                    spec_item["typeName"] = type_name
-
-                items_by_path[path] = spec_item
-
-            layer.Traverse("/", _traverse)
-
-            # Build hierarchy of item of specs
-            for path, item in sorted(items_by_path.items()):
-                parent = path.GetParentPath()
-                parent_item = items_by_path.get(parent, layer_item)
-                parent_item.add_child(item)
+                            add_child(list_change_item)
+
+                # Add these types intermixed just so we order attributes
+                # together nicely that are somewhat related, e.g. variant
+                # information together
+                for attr, add_fn in [
+                    ("reference", _add_list_item),
+                    ("payload", _add_list_item),
+                    ("relocates", _add_map_item),
+                    ("variantSelections", _add_map_item),
+                    ("variantSetName", _add_list_item),
+                ]:
+                    add_fn(attr)
+
+            elif isinstance(spec, attribute_spec_type):
+                spec_item.update(get_attribute_spec_data(spec))
+
+            # Specs inside variants are registered under the composed
+            # path on the stage they contribute to
+            composed_path = path.StripAllVariantSelections()
+            items_by_path[composed_path.pathString].append(spec_item)
+            items_by_spec_path[(layer_id, path.pathString)] = spec_item
+
+            _add_item(path, spec_item)
+
+        layer.Traverse(root_path, _traverse)
+
+        orphans = [
+            child for children in pending_children.values()
+            for child in children
+        ]
+        orphans.sort(key=operator.itemgetter(0))
+        return orphans
+
+    def set_build_types_filter(self, types):
+        """Only build property spec items of the given spec types.
+
+        Other property specs are skipped entirely on `refresh`. Prim specs
+        and any other specs are always built to preserve the hierarchy.
+
+        Arguments:
+            types (Iterable[str]): The spec type names to build, e.g.
+                "AttributeSpec". Build all specs when empty.
+
+        Returns:
+            bool: Whether the filter changed and requires a `refresh`.
+
+        """
+        types = set(types)
+        if types:
+            property_types = frozenset(
+                types.intersection(self.PropertySpecTypes)
+            )
+        else:
+            property_types = None
+
+        if property_types == self._build_property_types:
+            return False
+
+        self._build_property_types = property_types
+        return True
+
+    def get_items_for_path(self, path):
+        """Return the spec items of all layers for a path on the stage.
+
+        Arguments:
+            path (Union[Sdf.Path, str]): The prim or property path.
+
+        Returns:
+            list[Item]: The spec items.
+
+        """
+        if isinstance(path, Sdf.Path):
+            path = path.pathString
+        return list(self._items_by_path.get(path, ()))
+
+    def get_spec_count(self):
+        """Return the number of specs listed in the model"""
+        return sum(len(items) for items in self._items_by_path.values())
+
+    def update_paths(self, resynced_paths, changed_info_only_paths):
+        """Update the items for the changed paths of a stage change notice.
+
+        The items of resynced paths are rebuilt per layer and changes to the
+        values of existing specs are updated in-place, except for edits to
+        relationship targets or attribute connections which rebuild the
+        items of the property since those are child rows. A resync of the
+        absolute root, a change to the layer stack or resyncs of paths
+        without specs in the layer stack, e.g. specs in variants, require
+        a full `refresh` of the model instead.
+
+        Arguments:
+            resynced_paths (list[Sdf.Path]): Resynced paths on the stage.
+            changed_info_only_paths (list[Sdf.Path]): Paths on the stage
+                with only changes to their fields.
+
+        Returns:
+            bool: Whether all changes were applied. If not, the model
+                requires a `refresh`.
+
+        """
+        stage = self._stage
+        icons_by_path = {}
+        if resynced_paths:
+            layers = self._get_layer_stack()
+            if layers is None:
+                return False
+
+            # Descendants of resynced paths are rebuilt along with them.
+            # Sorted paths list any ancestors before their descendants.
+            resynced_path = None
+            for path in sorted(resynced_paths):
+                if resynced_path is not None and path.HasPrefix(
+                        resynced_path):
+                    continue
+                resynced_path = path
+
+                if path == Sdf.Path.absoluteRootPath:
+                    return False
+
+                if not self._resync_path(stage, layers, path, icons_by_path):
+                    return False
+
+        last_column = len(self.Columns) - 1
+        for path in changed_info_only_paths:
+            items = self.get_items_for_path(path)
+            for item in items:
+                if item["spec"].expired:
+                    return False
+
+            # Relationship targets and attribute connections are listed as
+            # child rows but their edits are not resyncs, so rebuild the
+            # items of the property when those changed
+            if any(self._has_changed_children(item) for item in items):
+                layers = self._get_layer_stack()
+                if layers is None or not self._resync_path(
+                        stage, layers, path, icons_by_path):
+                    return False
+                continue
+
+            for item in items:
+                spec = item["spec"]
+                if isinstance(spec, Sdf.AttributeSpec):
+                    item.update(get_attribute_spec_data(spec))
+
+                row = item.row()
+                self.dataChanged.emit(
+                    self.createIndex(row, 0, item),
+                    self.createIndex(row, last_column, item)
+                )
+        return True
+
+    def _get_layer_stack(self):
+        """Return the stage's layer stack if it matches the layer items.
+
+        Returns:
+            Optional[list[Sdf.Layer]]: The layers, or None if the layer
+                stack changed and the model requires a `refresh`.
+
+        """
+        stage = self._stage
+        if not stage:
+            return None
+
+        layers = stage.GetLayerStack()
+        if [layer.identifier for layer in layers] != [
+            item["identifier"] for item in self._root_item.children()
+        ]:
+            return None
+        return layers
+
+    @staticmethod
+    def _has_changed_children(item):
+        """Return whether the child paths of a property spec item changed"""
+        spec = item["spec"]
+        if not isinstance(spec, Sdf.PropertySpec):
+            return False
+
+        spec_path = spec.path
+        paths = []
+        spec.layer.Traverse(spec_path, paths.append)
+        child_paths = sorted(
+            path for path in paths if path.GetParentPath() == spec_path
+        )
+        return child_paths != [child["path"] for child in item.children()]
+
+    def _resync_path(self, stage, layers, path, icons_by_path):
+        """Rebuild the items of each layer for a resynced path.
+
+        Returns:
+            bool: Whether any layer has a spec for the path.
+
+        """
+        path_str = path.pathString
+        has_specs = False
+        for layer in layers:
+            layer_id = layer.identifier
+            old_item = self._items_by_spec_path.get((layer_id, path_str))
+            has_spec = bool(layer.GetObjectAtPath(path))
+            if old_item is None and not has_spec:
+                continue
+            has_specs = True
+
+            if old_item is not None:
+                parent_item = old_item.parent()
+                row = old_item.row()
+                self._unregister_items(layer_id, old_item)
+            else:
+                parent_path_str = path.GetParentPath().pathString
+                parent_item = self._items_by_spec_path.get(
+                    (layer_id, parent_path_str)
+                )
+                if parent_item is None:
+                    return False
+
+                # Insert in path order, after any list or map proxy items
+                row = parent_item.childCount()
+                for child_row, child in enumerate(parent_item.children()):
+                    child_path = child.get("path")
+                    if child_path is not None and path < child_path:
+                        row = child_row
+                        break
+
+            new_items = []
+            if has_spec:
+                new_items = self._collect_spec_items(
+                    stage, layer, path, self._items_by_path,
+                    self._items_by_spec_path, icons_by_path
+                )
+
+            parent_index = self.createIndex(parent_item.row(), 0, parent_item)
+            if old_item is not None:
+                self.beginRemoveRows(parent_index, row, row)
+                parent_item.remove_child(row)
+                self.endRemoveRows()
+
+            for _path, item in new_items:
+                self.beginInsertRows(parent_index, row, row)
+                parent_item.insert_child(row, item)
+                self.endInsertRows()
+                row += 1
+
+        return has_specs
+
+    def _unregister_items(self, layer_id, item):
+        """Remove the spec items of a layer at and below `item` from lookups"""
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            stack.extend(item.children())
+            if "spec" not in item:
+                continue
+
+            path = item["path"]
+            self._items_by_spec_path.pop((layer_id, path.pathString), None)
+            composed_path_str = path.StripAllVariantSelections().pathString
+            items = self._items_by_path.get(composed_path_str)
+            if items:
+                items[:] = [other for other in items if other is not item]
 
     def flags(self, index):
 
@@ -282,29 +632,26 @@ class StageSdfModel(TreeModel):
             item = index.internalPointer()
             spec = item.get("spec")
             if spec and isinstance(spec, Sdf.PrimSpec):
-                lookup = {
-                    label: key for key, label in SPECIFIER_LABEL.items()
-                }
-                value = lookup[value]
-                spec.specifier = value
+                spec.specifier = SPECIFIER_BY_LABEL[value]
                 return True
 
         return super(StageSdfModel, self).setData(index, value, role)
 
     def data(self, index, role):
+        # Items are read from the index directly instead of through
+        # `TreeModel.ItemRole` which would dispatch `data` again
 
         if role == QtCore.Qt.ForegroundRole:
-            item = index.data(TreeModel.ItemRole)
+            item = index.internalPointer()
             class_type_name = item.get("type")
-            color = self.Colors.get(class_type_name)
-            return color
+            return self.Brushes.get(class_type_name)
 
-        if index.column() == 2 and role == QtCore.Qt.DecorationRole:
-            item = index.data(TreeModel.ItemRole)
+        if role == QtCore.Qt.DecorationRole and index.column() == 2:
+            item = index.internalPointer()
             return item.get("icon")
 
         if role == QtCore.Qt.ToolTipRole:
-            item = index.data(TreeModel.ItemRole)
+            item = index.internalPointer()
             path = item.get("path")
             if path and isinstance(path, Sdf.Path):
                 path = path.pathString
@@ -317,26 +664,30 @@ class PrimSpectTypeFilterProxy(QtCore.QSortFilterProxyModel):
 
     def __init__(self, *args, **kwargs):
         super(PrimSpectTypeFilterProxy, self).__init__(*args, **kwargs)
-        self._filter_types = set()
+        self._filter_types = frozenset()
+        self._source_model = None
+
+    def setSourceModel(self, model):
+        self._source_model = model
+        super(PrimSpectTypeFilterProxy, self).setSourceModel(model)
 
     def set_types_filter(self, types):
-        self._filter_types = set(types)
+        self._filter_types = frozenset(types)
         self.invalidateFilter()
 
+    def has_types_filter(self):
+        return bool(self._filter_types)
+
     def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        index = model.index(source_row, 0, source_parent)
-        if not index.isValid():
-            return False
+        filter_types = self._filter_types
+        if filter_types:
+            index = self._source_model.index(source_row, 0, source_parent)
+            if not index.isValid():
+                return False
 
-        item = index.data(TreeModel.ItemRole)
-        item_type = item.get("type")
-        if (
-                self._filter_types
-                and item_type
-                and item_type not in self._filter_types
-        ):
-            return False
+            item_type = index.internalPointer().get("type")
+            if item_type and item_type not in filter_types:
+                return False
 
         return super(PrimSpectTypeFilterProxy,
                      self).filterAcceptsRow(source_row, source_parent)
@@ -430,10 +781,23 @@ class SpecEditorWindow(QtWidgets.QDialog):
         items = self.filter_list.selectedItems()
         types = {item.text().strip() for item in items}
         self.editor.proxy.set_types_filter(types)
-        self.editor.view.expandAll()
+        if self.editor.model.set_build_types_filter(types):
+            self.editor.on_refresh()
+        else:
+            self.editor.expand_rows()
 
 
 class SpecEditsWidget(QtWidgets.QWidget):
+    # Resizing columns to their contents measures every row in the view so
+    # it is skipped when the model lists more specs than this
+    max_specs_resize_to_contents = 500
+    # Expanding all rows lays out every row in the view so when not
+    # filtering, larger stages are only expanded up to `max_expand_depth`
+    max_specs_expand_all = 5000
+    max_expand_depth = 2
+    # Initial widths of the columns, used as is for larger stages
+    default_column_widths = [260, 60, 140, 180, 120]
+
     def __init__(self, stage=None, parent=None):
         super(SpecEditsWidget, self).__init__(parent=parent)
 
@@ -446,6 +810,8 @@ class SpecEditsWidget(QtWidgets.QWidget):
         model = StageSdfModel(stage)
         proxy = PrimSpectTypeFilterProxy()
         proxy.setRecursiveFilteringEnabled(True)
+        proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        proxy.setFilterKeyColumn(0)
         proxy.setSourceModel(model)
         view = QtWidgets.QTreeView()
         view.setModel(proxy)
@@ -462,6 +828,10 @@ class SpecEditsWidget(QtWidgets.QWidget):
         view.setItemDelegateForColumn(1, specifier_delegate)
         view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         view.setUniformRowHeights(True)
+        header = view.header()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        for column, width in enumerate(self.default_column_widths):
+            header.resizeSection(column, width)
         view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         view.customContextMenuRequested.connect(self.on_context_menu)
 
@@ -487,8 +857,28 @@ class SpecEditsWidget(QtWidgets.QWidget):
         refresh.clicked.connect(self.on_refresh)
         delete.clicked.connect(self.on_delete)
         filter_edit.textChanged.connect(self.on_filter_changed)
+        proxy.rowsInserted.connect(self._on_rows_inserted)
 
         self._listeners = []
+        self._filter_text = ""
+        # Only rows inserted by `update_paths` are expanded, the proxy also
+        # inserts rows when a filter change accepts them again
+        self._expand_inserted_rows = False
+
+        # Coalesce stage changes into a single refresh per timeout
+        refresh_timer = QtCore.QTimer(self)
+        refresh_timer.setSingleShot(True)
+        refresh_timer.setInterval(100)
+        refresh_timer.timeout.connect(self.on_refresh)
+        self._refresh_timer = refresh_timer
+
+        # Only filter once typing pauses since each filter pass goes over
+        # all rows of the model
+        filter_timer = QtCore.QTimer(self)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(150)
+        filter_timer.timeout.connect(self._apply_filter)
+        self._filter_timer = filter_timer
 
         self.set_refresh_on_changes(True)
         self.on_refresh()
@@ -499,7 +889,7 @@ class SpecEditsWidget(QtWidgets.QWidget):
                 return
             log.debug("Adding Prim Spec listener")
             sender = self.model._stage
-            listener = Tf.Notice.Register(Usd.Notice.StageContentsChanged,
+            listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged,
                                           self.on_stage_changed_notice,
                                           sender)
             self._listeners.append(listener)
@@ -512,13 +902,39 @@ class SpecEditsWidget(QtWidgets.QWidget):
             self._listeners.clear()
 
     def on_stage_changed_notice(self, notice, sender):
-        self.proxy.invalidate()
-        schedule(self.on_refresh, 100, channel="changes")
+        # Any changes are included in an already scheduled refresh
+        if self._refresh_timer.isActive():
+            return
+
+        # Update the changed values in-place where possible, otherwise
+        # refresh the full model
+        self._expand_inserted_rows = True
+        try:
+            updated = self.model.update_paths(
+                notice.GetResyncedPaths(),
+                notice.GetChangedInfoOnlyPaths()
+            )
+        finally:
+            self._expand_inserted_rows = False
+        if updated:
+            return
+
+        self._refresh_timer.start()
+
+    def _on_rows_inserted(self, parent, first, last):
+        # Expand rows rebuilt for changes to the stage like `on_refresh` does
+        if not self._expand_inserted_rows:
+            return
+        for row in range(first, last + 1):
+            self.view.expandRecursively(self.proxy.index(row, 0, parent))
 
     def on_filter_changed(self, text):
-        self.proxy.setFilterRegularExpression(".*{}.*".format(text))
-        self.proxy.invalidateFilter()
-        self.view.expandAll()
+        self._filter_text = text
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        self.proxy.setFilterFixedString(self._filter_text)
+        self.expand_rows()
 
     def showEvent(self, event):
         state = self.auto_refresh.checkState() == QtCore.Qt.Checked
@@ -552,20 +968,49 @@ class SpecEditsWidget(QtWidgets.QWidget):
         menu.exec_(self.view.mapToGlobal(point))
 
     def on_refresh(self):
-        self.model.refresh()
-        self.proxy.invalidate()
+        self._refresh_timer.stop()
+
+        # Avoid repainting the view while the model is rebuilt
+        self.view.setUpdatesEnabled(False)
+        try:
+            self.model.refresh()
+            self.proxy.invalidate()
+        finally:
+            self.view.setUpdatesEnabled(True)
+
+        # Column 0 is sized to the layer names, before expanding
         self.view.resizeColumnToContents(0)
-        self.view.expandAll()
-        self.view.resizeColumnToContents(1)
-        self.view.resizeColumnToContents(2)
-        self.view.resizeColumnToContents(3)
-        self.view.resizeColumnToContents(4)
+        self.expand_rows()
+        if self.model.get_spec_count() > self.max_specs_resize_to_contents:
+            # Keep the current column widths which the user can resize
+            return
+
+        # Resize all columns in a single pass over the sections
+        self.view.header().resizeSections(
+            QtWidgets.QHeaderView.ResizeToContents
+        )
+
+    def expand_rows(self):
+        """Expand the rows in the view"""
+        if (
+            self.model.get_spec_count() > self.max_specs_expand_all
+            and not self._filter_text
+            and not self.proxy.has_types_filter()
+        ):
+            self.view.expandToDepth(self.max_expand_depth)
+        else:
+            # Filtered rows only include matches and their parents
+            self.view.expandAll()
 
     def delete_indexes(self, indexes):
+        return self.delete_items(
+            index.data(TreeModel.ItemRole) for index in indexes
+        )
+
+    def delete_items(self, items):
         specs = []
         deletables = []
-        for index in indexes:
-            item = index.data(TreeModel.ItemRole)
+        for item in items:
             spec = item.get("spec")
             if item.get("type") == "PseudoRootSpec":
                 continue
@@ -579,11 +1024,25 @@ class SpecEditsWidget(QtWidgets.QWidget):
         if not specs and not deletables:
             return False
 
+        # Skip specs of which an ancestor in the same layer is also removed
+        # since those are removed along with their ancestor
+        specs = [spec for spec in specs if not spec.expired]
+        paths_by_layer = defaultdict(set)
+        for spec in specs:
+            paths_by_layer[spec.layer.identifier].add(spec.path)
+
+        top_specs = []
+        for spec in specs:
+            paths = paths_by_layer[spec.layer.identifier]
+            parent_path = spec.path.GetParentPath()
+            if any(path in paths for path in parent_path.GetAncestorsRange()):
+                continue
+            top_specs.append(spec)
+
         with Sdf.ChangeBlock():
-            for spec in specs:
-                if spec and not spec.expired:
-                    log.debug(f"Removing spec: %s", spec.path)
-                    remove_spec(spec)
+            for spec in top_specs:
+                log.debug(f"Removing spec: %s", spec.path)
+                remove_spec(spec)
             for deletable in deletables:
                 deletable.delete()
         return True
@@ -591,8 +1050,11 @@ class SpecEditsWidget(QtWidgets.QWidget):
     def on_delete(self):
 
         selection_model = self.view.selectionModel()
-        rows = selection_model.selectedRows()
-        has_deleted = self.delete_indexes(rows)
+        items = [
+            index.data(TreeModel.ItemRole)
+            for index in selection_model.selectedRows()
+        ]
+        has_deleted = self.delete_items(items)
         if has_deleted and not self._listeners:
             self.on_refresh()
 
@@ -620,20 +1082,21 @@ class SpecEditsWidget(QtWidgets.QWidget):
 
         # Get highest paths in the spec selection and exclude any selected
         # children since those will be moved along anyway
-        paths = {spec.path.pathString for spec in specs}
+        # Sorting by the path elements lists each path directly before its
+        # descendants, so a path is a top path if it is not a descendant of
+        # the previous top path.
+        specs_by_path = sorted(
+            ((spec.path.pathString, spec) for spec in specs),
+            key=lambda pair: pair[0].split("/")
+        )
         top_specs = []
-        for spec in specs:
-
-            skip = False
-            parent_path = spec.path.pathString.rsplit("/", 1)[0]
-            while "/" in parent_path:
-                if parent_path in paths:
-                    skip = True
-                    break
-                parent_path = parent_path.rsplit("/", 1)[0]
-            if skip:
+        top_path_prefix = None
+        for path, spec in specs_by_path:
+            if top_path_prefix is not None and path.startswith(
+                    top_path_prefix):
                 continue
 
+            top_path_prefix = path + "/"
             top_specs.append(spec)
 
         if not top_specs:
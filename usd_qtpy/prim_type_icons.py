@@ -1,3 +1,5 @@
+import functools
+
 from .resources import get_icon
 
 
@@ -9,49 +11,70 @@ class PrimTypeIconProvider:
     # TODO: We might want to colorize the icon in the model based on some
     #   other piece of data. We might need a custom icon painter then?
 
+    __slots__ = ("_type_to_icon", "_icons")
+
+    # Icon names by exact type name
+    # Maybe use `prim.IsA(prim_type)` but preferably we can go based off
+    # of only the type name so that cache makes sense for all types
+    ICON_BY_TYPE_NAME = {
+        "Scope": "crosshair",
+        "": "help-circle",
+        "Xform": "move",
+        "Camera": "video",
+        "Material": "globe",
+        "NodeGraph": "globe",
+        "Shader": "globe",
+        "Mesh": "box",
+        "Capsule": "box",
+        "Cone": "box",
+        "Cube": "box",
+        "Cylinder": "box",
+        "Sphere": "box",
+    }
+    # Icon names for type names without an exact match, checked in order
+    ICON_BY_TYPE_NAME_SUFFIX = (
+        ("Light", "sun"),
+    )
+    ICON_BY_TYPE_NAME_PREFIX = (
+        ("Render", "zap"),
+        ("Physics", "wind"),
+    )
+    # All icon names that can be returned by `get_icon_from_type_name`
+    ICON_NAMES = frozenset(ICON_BY_TYPE_NAME.values()).union(
+        (name for _, name in ICON_BY_TYPE_NAME_SUFFIX),
+        (name for _, name in ICON_BY_TYPE_NAME_PREFIX),
+    )
+
     def __init__(self):
         self._type_to_icon = {}
 
+        # Load the small set of icons upfront so resolving an icon for a
+        # new type name during painting does not hit the disk
+        self._icons = {name: get_icon(name) for name in self.ICON_NAMES}
+
     def get_icon_from_type_name(self, type_name):
-        if type_name in self._type_to_icon:
+        try:
             return self._type_to_icon[type_name]
+        except KeyError:
+            pass
 
         # Icon by type matches
         # TODO: Rewrite the checks below to be based off of the base type
         #   instead of the exact type so that inherited types are also caught
         #   as material, light, etc.
-        if type_name == "Scope":
-            name = "crosshair"
-        elif type_name == "":
-            name = "help-circle"
-        elif type_name == "Xform":
-            name = "move"
-        elif type_name == "Camera":
-            name = "video"
-        # Maybe use `prim.IsA(prim_type)` but preferably we can go based off
-        # of only the type name so that cache makes sense for all types
-        elif type_name in {"Material", "NodeGraph", "Shader"}:
-            name = "globe"
-        elif type_name in {"Mesh",
-                           "Capsule",
-                           "Cone",
-                           "Cube",
-                           "Cylinder",
-                           "Sphere"}:
-            name = "box"
-        elif type_name.endswith("Light"):
-            name = "sun"
-        elif type_name.startswith("Render"):
-            name = "zap"
-        elif type_name.startswith("Physics"):
-            name = "wind"
-        else:
-            name = None
-
-        # Define icon
-        icon = None
-        if name:
-            icon = get_icon(name)
+        name = self.ICON_BY_TYPE_NAME.get(type_name)
+        if name is None:
+            for suffix, suffix_name in self.ICON_BY_TYPE_NAME_SUFFIX:
+                if type_name.endswith(suffix):
+                    name = suffix_name
+                    break
+            else:
+                for prefix, prefix_name in self.ICON_BY_TYPE_NAME_PREFIX:
+                    if type_name.startswith(prefix):
+                        name = prefix_name
+                        break
+
+        icon = self._icons.get(name)
 
         self._type_to_icon[type_name] = icon
         return icon
@@ -59,3 +82,14 @@ class PrimTypeIconProvider:
     def get_icon(self, prim):
         type_name = prim.GetTypeName()
         return self.get_icon_from_type_name(type_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_provider():
+    """Return the `PrimTypeIconProvider` shared by all models.
+
+    Returns:
+        PrimTypeIconProvider: The shared icon provider.
+
+    """
+    return PrimTypeIconProvider()
@@ -1,4 +1,3 @@
-import os
 from collections import namedtuple, defaultdict
 from functools import partial
 
@@ -10,6 +9,9 @@ from .lib.qt import DropFilesPushButton
 from .prim_hierarchy_model import HierarchyModel
 
 
+Change = namedtuple("change", ["old", "new"])
+
+
 def get_applied_items(list_proxy):
     """Backwards compatible equivalent of `GetAppliedItems()`"""
     return list_proxy.ApplyEditsToList([])
@@ -32,10 +34,6 @@ class PickPrimPath(QtWidgets.QDialog):
 
         layout.addWidget(view)
 
-        if prim_path:
-            # Set selection to the given prim path if it exists
-            pass
-
         # Add some standard buttons (Cancel/Ok) at the bottom of the dialog
         buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.Ok |
@@ -48,11 +46,53 @@ class PickPrimPath(QtWidgets.QDialog):
         self.model = model
         self.view = view
 
+        if prim_path and Sdf.Path.IsValidPathString(prim_path):
+            # Set selection to the given prim path if it exists
+            self.select_path(Sdf.Path(prim_path))
+
         view.doubleClicked.connect(self.accept)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         self.accepted.connect(self.on_accept)
 
+    def select_path(self, path):
+        """Select the prim path in the view if it exists.
+
+        Only the parents of the prim are expanded and the view is not
+        updated until all of them are expanded.
+
+        Arguments:
+            path (Sdf.Path): The prim path to select.
+
+        """
+        model = self.model
+        view = self.view
+        # The model's only top-level row is the pseudo-root
+        index = model.index(0, 0, QtCore.QModelIndex())
+        if not index.isValid():
+            return
+
+        view.setUpdatesEnabled(False)
+        try:
+            for prefix in path.MakeAbsolutePath(
+                    Sdf.Path.absoluteRootPath).GetPrefixes():
+                view.expand(index)
+
+                # Find the child for the next path element
+                parent = index
+                for row in range(model.rowCount(parent)):
+                    index = model.index(row, 0, parent)
+                    prim = index.data(HierarchyModel.PrimRole)
+                    if prim and prim.GetPath() == prefix:
+                        break
+                else:
+                    return
+
+            view.setCurrentIndex(index)
+            view.scrollTo(index)
+        finally:
+            view.setUpdatesEnabled(True)
+
     def on_accept(self):
         indexes = self.view.selectedIndexes()
         if not indexes:
@@ -74,7 +114,11 @@ class RefPayloadWidget(QtWidgets.QWidget):
 
     delete_requested = QtCore.Signal()
 
-    def __init__(self, item=None, item_type=None, parent=None):
+    def __init__(self,
+                 item=None,
+                 item_type=None,
+                 stage_cache=None,
+                 parent=None):
         super(RefPayloadWidget, self).__init__(parent=parent)
 
         if item is None and item_type is None:
@@ -86,6 +130,7 @@ class RefPayloadWidget(QtWidgets.QWidget):
 
         self._original_item = item
         self._item_type = item_type
+        self._stage_cache = stage_cache
 
         layout = QtWidgets.QHBoxLayout(self)
 
@@ -152,10 +197,17 @@ class RefPayloadWidget(QtWidgets.QWidget):
 
         prim_path = self.default_prim.text()
 
-        if not os.path.exists(filepath):
-            raise ValueError(f"File does not exist: {filepath}")
-
-        stage = Usd.Stage.Open(filepath)
+        # Let USD resolve the path instead of checking it on disk first so
+        # that asset identifiers work and no extra stat is done. The picker
+        # only browses the namespace so payloads do not need to be loaded
+        if self._stage_cache is not None:
+            # Reuse the stage when picking from the same file again
+            with Usd.StageCacheContext(self._stage_cache):
+                stage = Usd.Stage.Open(filepath, load=Usd.Stage.LoadNone)
+        else:
+            stage = Usd.Stage.Open(filepath, load=Usd.Stage.LoadNone)
+        if not stage:
+            raise ValueError(f"Unable to open USD file: {filepath}")
         picker = PickPrimPath(stage=stage, prim_path=prim_path, parent=self)
 
         def on_picked(path):
@@ -226,12 +278,20 @@ class ReferenceListWidget(QtWidgets.QDialog):
         layout.addLayout(references)
 
         add_icon = get_icon("plus")
+        browse_icon = get_icon("folder")
         add_button = DropFilesPushButton(add_icon, "")
         add_button.setToolTip("Add reference")
         add_button.clicked.connect(self.on_add_reference)
         add_button.files_dropped.connect(partial(self.on_dropped_files,
                                                  "references"))
-        layout.addWidget(add_button)
+        browse_button = QtWidgets.QPushButton(browse_icon, "")
+        browse_button.setToolTip("Add references from files...")
+        browse_button.clicked.connect(partial(self.on_browse_files,
+                                              "references"))
+        add_layout = QtWidgets.QHBoxLayout()
+        layout.addLayout(add_layout)
+        add_layout.addWidget(add_button, stretch=1)
+        add_layout.addWidget(browse_button)
 
         layout.addWidget(QtWidgets.QLabel("Payloads"))
         payloads = QtWidgets.QVBoxLayout()
@@ -243,7 +303,14 @@ class ReferenceListWidget(QtWidgets.QDialog):
         add_button.clicked.connect(self.on_add_payload)
         add_button.files_dropped.connect(partial(self.on_dropped_files,
                                                  "payloads"))
-        layout.addWidget(add_button)
+        browse_button = QtWidgets.QPushButton(browse_icon, "")
+        browse_button.setToolTip("Add payloads from files...")
+        browse_button.clicked.connect(partial(self.on_browse_files,
+                                              "payloads"))
+        add_layout = QtWidgets.QHBoxLayout()
+        layout.addLayout(add_layout)
+        add_layout.addWidget(add_button, stretch=1)
+        add_layout.addWidget(browse_button)
 
         layout.addStretch()
 
@@ -262,22 +329,39 @@ class ReferenceListWidget(QtWidgets.QDialog):
         self.prim = prim
         self.references_layout = references
         self.payloads_layout = payloads
+        self._layouts = {
+            "references": references,
+            "payloads": payloads
+        }
+        # Stages opened to pick default prims, shared by all entries and
+        # released when the dialog closes
+        self._stage_cache = Usd.StageCache()
+        self.finished.connect(self._on_finished)
+
+        # Track the entry widgets per key so they can be iterated directly
+        # instead of querying the layouts item by item
+        self._widgets = {
+            "references": [],
+            "payloads": []
+        }
 
         self.refresh()
 
         self.accepted.connect(self.on_accept)
 
+    def _on_finished(self, result):
+        # Release the stages opened by the prim pickers
+        self._stage_cache.Clear()
+
     def refresh(self):
 
         def clear(layout):
-            while layout_item:= layout.takeAt(0):
-                widget = layout_item.widget()
+            # Take from the end so the layout doesn't shift remaining items
+            for i in reversed(range(layout.count())):
+                widget = layout.takeAt(i).widget()
                 if widget:
                     widget.deleteLater()
 
-        clear(self.payloads_layout)
-        clear(self.references_layout)
-
         # Store items and widgets for the references
         prim = self.prim
 
@@ -290,53 +374,76 @@ class ReferenceListWidget(QtWidgets.QDialog):
             references.extend(get_applied_items(prim_spec.referenceList))
             payloads.extend(get_applied_items(prim_spec.payloadList))
 
-        for reference in references:
-            self._add_widget(self.references_layout, item=reference)
+        # Rebuild all widgets with updates disabled so the dialog only
+        # lays out and repaints once instead of once per entry
+        self.setUpdatesEnabled(False)
+        try:
+            for key, layout in self._layouts.items():
+                clear(layout)
+                self._widgets[key].clear()
 
-        for payload in payloads:
-            self._add_widget(self.payloads_layout, item=payload)
+            for reference in references:
+                self._add_widget("references", item=reference)
+
+            for payload in payloads:
+                self._add_widget("payloads", item=payload)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_dropped_files(self, key, urls):
         files = [url.toLocalFile() for url in urls]
-        if key == "references":
-            for filepath in files:
-                self._add_widget(self.references_layout,
-                                 item=Sdf.Reference(assetPath=filepath))
-        elif key == "payloads":
+        self._add_files(key, files)
+
+    def on_browse_files(self, key):
+        filenames, _selected_filter = QtWidgets.QFileDialog.getOpenFileNames(
+            parent=self,
+            caption=f"Add {key} from USD files",
+            filter="USD (*.usd *.usda *.usdc);"
+        )
+        if filenames:
+            self._add_files(key, filenames)
+
+    def _add_files(self, key, files):
+        """Add an entry per filepath with a single layout and repaint"""
+        item_type = {
+            "references": Sdf.Reference,
+            "payloads": Sdf.Payload
+        }[key]
+        self.setUpdatesEnabled(False)
+        try:
             for filepath in files:
-                self._add_widget(self.payloads_layout,
-                                 item=Sdf.Payload(assetPath=filepath))
+                self._add_widget(key, item=item_type(assetPath=filepath))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_add_payload(self):
-        self._add_widget(self.payloads_layout, item_type=Sdf.Payload)
+        self._add_widget("payloads", item_type=Sdf.Payload)
 
     def on_add_reference(self):
-        self._add_widget(self.references_layout, item_type=Sdf.Reference)
-
-    def _add_widget(self, layout, item=None, item_type=None):
-        def remove_widget(layout, widget):
-            index = layout.indexOf(widget)
-            if index >= 0:
-                layout.takeAt(index)
+        self._add_widget("references", item_type=Sdf.Reference)
+
+    def _add_widget(self, key, item=None, item_type=None):
+        widget = RefPayloadWidget(item=item,
+                                  item_type=item_type,
+                                  stage_cache=self._stage_cache)
+        widget.delete_requested.connect(self._on_delete_requested)
+        self._layouts[key].addWidget(widget)
+        self._widgets[key].append(widget)
+
+    def _on_delete_requested(self):
+        widget = self.sender()
+        for key, widgets in self._widgets.items():
+            if widget in widgets:
+                widgets.remove(widget)
+                self._layouts[key].removeWidget(widget)
                 widget.deleteLater()
-
-        widget = RefPayloadWidget(item=item, item_type=item_type)
-        widget.delete_requested.connect(partial(remove_widget, layout, widget))
-        layout.addWidget(widget)
+                return
 
     def on_accept(self):
-        Change = namedtuple("change", ["old", "new"])
-
         # Get the configured references/payloads
         items = defaultdict(list)
-        for key, layout in {
-            "references": self.references_layout,
-            "payloads": self.payloads_layout
-        }.items():
-            for i in range(layout.count()):
-                layout_item = layout.itemAt(i)
-                widget = layout_item.widget()  # -> RefPayloadWidget
-
+        for key, widgets in self._widgets.items():
+            for widget in widgets:
                 new_item = widget.item
                 if not new_item:
                     # Skip empty entries
@@ -350,7 +457,8 @@ class ReferenceListWidget(QtWidgets.QDialog):
         #  entries not amongst the new changes + ensure ordering is correct
         #  For now we completely clear all specs
         prim = self.prim
-        for prim_spec in list(prim.GetPrimStack()):
+        # `GetPrimStack` already returns a new list so no copy is needed
+        for prim_spec in prim.GetPrimStack():
             if prim_spec.expired:
                 continue
 
@@ -1,13 +1,18 @@
 import os
+import functools
 from qtpy import QtGui
 
 
 FEATHERICONS_ROOT = os.path.join(os.path.dirname(__file__), "feathericons")
 
 
+@functools.lru_cache(maxsize=None)
 def get_icon_path(name):
     return os.path.join(FEATHERICONS_ROOT, f"{name}.svg")
 
 
+@functools.lru_cache(maxsize=None)
 def get_icon(name):
+    # QIcon is implicitly shared so the same instance can be used by
+    # many widgets without reloading the svg from disk
     return QtGui.QIcon(get_icon_path(name))
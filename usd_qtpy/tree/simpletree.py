@@ -115,29 +115,37 @@ class Item(dict):
     >>> assert item["name"] == "John"
 
     """
+    # Avoid an attribute `__dict__` per item next to the item's own data
+    __slots__ = ("_children", "_parent", "_row")
 
     def __init__(self, data=None):
         super(Item, self).__init__()
 
-        self._children = list()
+        # Most items are leaves so the list is only created on `add_child`
+        self._children = None
         self._parent = None
+        self._row = -1
 
         if data is not None:
             assert isinstance(data, dict)
             self.update(data)
 
     def childCount(self):
+        if self._children is None:
+            return 0
         return len(self._children)
 
     def child(self, row):
 
-        if row >= len(self._children):
+        if row >= self.childCount():
             log.warning("Invalid row as child: %s", row)
             return
 
         return self._children[row]
 
     def children(self):
+        if self._children is None:
+            return []
         return self._children
 
     def parent(self):
@@ -147,12 +155,38 @@ class Item(dict):
         """
         Returns:
              int: Index of this item under parent"""
-        if self._parent is not None:
-            siblings = self.parent().children()
-            return siblings.index(self)
-        return -1
+        # The row is stored on `add_child` since looking it up in the
+        # siblings is slow for items with many siblings
+        return self._row
 
     def add_child(self, child):
         """Add a child to this item"""
         child._parent = self
-        self._children.append(child)
+        if self._children is None:
+            child._row = 0
+            self._children = [child]
+        else:
+            child._row = len(self._children)
+            self._children.append(child)
+
+    def insert_child(self, row, child):
+        """Insert a child at `row` under this item"""
+        child._parent = self
+        if self._children is None:
+            self._children = []
+        self._children.insert(row, child)
+        self._update_rows(row)
+
+    def remove_child(self, row):
+        """Remove the child at `row` under this item and return it"""
+        child = self._children.pop(row)
+        child._parent = None
+        child._row = -1
+        self._update_rows(row)
+        return child
+
+    def _update_rows(self, start):
+        """Update the stored rows of the children from `start` onwards"""
+        children = self._children
+        for row in range(start, len(children)):
+            children[row]._row = row